@@ -4,20 +4,120 @@ Automates Google searches and clicks on your website when found in search result
 """
 
 import asyncio
+import hashlib
 import time
 import random
 import re
 import urllib.parse
+from collections import Counter
+from dataclasses import dataclass, asdict
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
-from typing import List, Dict
+from typing import List, Dict, Optional
 import json
+import logging
+import logging.handlers
 import os
+import argparse
+import queue
+import subprocess
+import sys
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # orjson is optional - fall back to the standard library parser
+    def _json_loads(data: bytes):
+        return json.loads(data.decode('utf-8'))
+
+logger = logging.getLogger(__name__)
+
 # Configuration - Load from config.json if available, otherwise use defaults
 CONFIG_FILE = "config.json"
+RESULT_CACHE_FILE = "result_cache.json"
 GOOGLE_URL = "https://www.google.com"
 
+# Present once a SERP has rendered its organic results
+SERP_RESULTS_SELECTOR = "div#search, div#rso, div.g"
+
+# Precompiled pattern for pulling the reCAPTCHA site key out of page HTML
+_SITEKEY_RE = re.compile(r'data-sitekey="([^"]+)"')
+
+# Summary icon per (clicked, found)
+_STATUS_ICONS = {
+    (True, True): "✅",
+    (True, False): "✅",
+    (False, True): "🔍",
+    (False, False): "❌",
+}
+
+# Extra HTTP headers sent with every request from the browser context
+EXTRA_HTTP_HEADERS = {
+    'Accept-Language': 'ja-JP,ja;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Runs before any page script: override webdriver / plugins / languages properties
+_INIT_SCRIPT = """
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined
+});
+
+// Override plugins
+Object.defineProperty(navigator, 'plugins', {
+    get: () => [1, 2, 3, 4, 5]
+});
+
+// Override languages
+Object.defineProperty(navigator, 'languages', {
+    get: () => ['ja-JP', 'ja', 'en-US', 'en']
+});
+"""
+
+# Single querySelector probe covering every CAPTCHA indicator we look for
+_CAPTCHA_JS = """() => !!document.querySelector(
+    "iframe[src*='recaptcha'], div[id*='recaptcha'], div[class*='captcha'], iframe[title*='reCAPTCHA'], "
+    + "#captcha-form, form[action*='sorry']")"""
+
+# Resolves once check_for_captcha would report no CAPTCHA - always the exact negation of _CAPTCHA_JS
+_CAPTCHA_SOLVED_JS = f"() => !({_CAPTCHA_JS})()"
+
+# Returns [{h: raw href, f: resolved href, i: index among a[href], p: organic result position}]
+# for anchors pointing at the target domain. p counts result title links (those wrapping an <h3>)
+# up to and including the match, falling back to the 1-based index among matches.
+_TARGET_LINKS_JS = """([domain, target, limit]) => {
+    const organic = [...document.querySelectorAll('#rso a[href]:has(h3), div.g a[href]:has(h3)')];
+    const rank = a => organic.filter(o => o === a
+        || (o.compareDocumentPosition(a) & Node.DOCUMENT_POSITION_FOLLOWING)).length;
+    return [...document.querySelectorAll('a[href]')]
+        .map((a, i) => ({a, h: a.getAttribute('href') || '', f: a.href, i}))
+        .filter(x => x.h.toLowerCase().includes(domain) || x.h.includes(target))
+        .slice(0, limit)
+        .map((x, n) => ({h: x.h, f: x.f, i: x.i, p: rank(x.a) || n + 1}));
+}"""
+
+# Returns the href of the first usable "Next" pagination link, or null on the last page
+_NEXT_PAGE_JS = """() => {
+    const usable = a => a && a.href && a.getAttribute('href') !== '#'
+        && !a.hasAttribute('aria-disabled') && a.offsetParent !== null;
+    for (const sel of ['a#pnnext', "a[aria-label*='Next']", "a[aria-label*='次へ']"]) {
+        const a = document.querySelector(sel);
+        if (usable(a)) return a.href;
+    }
+    for (const a of document.querySelectorAll('a[href]')) {
+        const text = a.textContent.trim();
+        if ((text === 'Next' || text === '次へ') && usable(a)) return a.href;
+    }
+    // Fall back to the numbered link for the next block of 10 results
+    const start = parseInt(new URLSearchParams(location.search).get('start') || '0', 10);
+    const a = document.querySelector(`a[href*='start=${start + 10}']`);
+    return usable(a) ? a.href : null;
+}"""
+
 def load_config():
     """Load configuration from config.json or use defaults."""
     defaults = {
@@ -39,25 +139,51 @@ def load_config():
         "use_persistent_context": True,
         "wait_for_captcha_manual": True,
         "skip_captcha": False,
+        "direct_search_url": False,
+        "blocked_resource_types": ["image", "font", "media"],
+        "result_cache_ttl_hours": 0,
+        "browser_daemon_port": None,
         "captcha_service": None,
         "captcha_api_key": None
     }
     
     if os.path.exists(CONFIG_FILE):
         try:
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                # Merge with defaults
-                for key in defaults:
-                    if key not in config:
-                        config[key] = defaults[key]
-                return config
+            config = _json_loads(Path(CONFIG_FILE).read_bytes())
+            # Merge with defaults
+            for key in defaults:
+                if key not in config:
+                    config[key] = defaults[key]
+            return config
         except Exception as e:
-            print(f"⚠️  Error loading config.json: {e}. Using defaults.")
+            logger.warning(f"⚠️  Error loading config.json: {e}. Using defaults.")
             return defaults
     else:
         return defaults
 
+def clean_result_url(href):
+    """Turn a search-result href into an absolute URL, unwrapping Google's /url? redirects."""
+    # Common case: already an absolute URL, nothing to parse
+    if not href or href.startswith(('http://', 'https://')):
+        return href
+    
+    # Remove Google's tracking parameters
+    if href.startswith('/url?'):
+        parsed = urllib.parse.parse_qs(urllib.parse.urlparse(href).query)
+        if 'q' in parsed:
+            href = parsed['q'][0]
+        elif 'url' in parsed:
+            href = parsed['url'][0]
+        if href.startswith(('http://', 'https://')):
+            return href
+    
+    # Ensure it's a full URL
+    if href.startswith('//'):
+        return 'https:' + href
+    elif href.startswith('/'):
+        return GOOGLE_URL + href
+    return 'https://' + href
+
 CONFIG = load_config()
 KEYWORDS = CONFIG["keywords"]
 TARGET_URL = CONFIG["target_url"]
@@ -68,26 +194,140 @@ HEADLESS = CONFIG["headless"]
 USE_PERSISTENT_CONTEXT = CONFIG.get("use_persistent_context", True)
 WAIT_FOR_CAPTCHA_MANUAL = CONFIG.get("wait_for_captcha_manual", True)
 SKIP_CAPTCHA = CONFIG.get("skip_captcha", False)
+DIRECT_SEARCH_URL = CONFIG.get("direct_search_url", False)
+RESULT_CACHE_TTL = (CONFIG.get("result_cache_ttl_hours") or 0) * 3600  # seconds, 0 disables the cache
+# If set, keep Chromium running between runs and reconnect over CDP on this port
+BROWSER_DAEMON_PORT = CONFIG.get("browser_daemon_port", None)
+# Sub-resource types aborted in the browser (add "stylesheet" to also skip CSS)
+BLOCKED_RESOURCE_TYPES = frozenset(CONFIG.get("blocked_resource_types") or ())
 CAPTCHA_SERVICE = CONFIG.get("captcha_service", None)  # Options: "2captcha", "anticaptcha", None
 CAPTCHA_API_KEY = CONFIG.get("captcha_api_key", None)
 
 
+# __slots__ on dataclasses needs Python 3.10+; older versions fall back to a regular dataclass
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
+class ResultRow:
+    """Outcome of searching one keyword."""
+    keyword: str
+    found: bool = False
+    page: Optional[int] = None
+    position: Optional[int] = None
+    clicked: bool = False
+    error: Optional[str] = None
+    cached: bool = False  # True if reused from result_cache.json instead of searched this run
+
+
+# Launch flags not passed to the browser daemon, which stays up with a CDP port open
+_DAEMON_UNSAFE_ARGS = {
+    '--no-sandbox',
+    '--disable-web-security',
+    '--disable-features=IsolateOrigins,site-per-process',
+    '--disable-site-isolation-trials',
+}
+
+
+def _browser_daemon_url() -> str:
+    return f"http://127.0.0.1:{BROWSER_DAEMON_PORT}"
+
+
+async def shutdown_browser_daemon():
+    """Close the long-running Chromium started by a previous run (see browser_daemon_port)."""
+    if not BROWSER_DAEMON_PORT:
+        logger.info("⚠️  browser_daemon_port is not set in config.json - nothing to shut down.")
+        return
+    async with async_playwright() as p:
+        try:
+            browser = await p.chromium.connect_over_cdp(_browser_daemon_url())
+        except Exception:
+            logger.info(f"ℹ️  No browser running on port {BROWSER_DAEMON_PORT}.")
+            return
+        session = await browser.new_browser_cdp_session()
+        try:
+            await session.send("Browser.close")
+        except Exception:
+            pass  # The connection drops as the browser exits
+        logger.info("🛑 Browser daemon shut down.")
+
+
 class SEOAutomation:
     def __init__(self, keywords: List[str], target_url: str):
-        self.keywords = keywords
+        # Drop blank and duplicate keywords, keeping first-seen order
+        self.keywords = list(dict.fromkeys(k.strip() for k in keywords if k and k.strip()))
         self.target_url = target_url
-        self.results = []
+        # Host names are case-insensitive; lower-case once so every match can compare directly
+        self.domain = (urllib.parse.urlparse(target_url).netloc or target_url.split("/")[0]).lower()
+        self.results: List[ResultRow] = []
         self.user_data_dir = Path.home() / ".playwright_seo_browser"
+        self._next_action_ts = 0.0  # time.monotonic() before which the next paced action must wait
+        self._result_page_pool = []  # Idle tabs reused for opening found results
+        self._captcha_cache = {}  # page URL -> CAPTCHA present, reset on navigation
+        self._captcha_seen = False  # Any CAPTCHA during the current search_and_click
+        self._last_search_complete = False  # Whether the last search_and_click result can be cached
+        self._result_cache = self._load_result_cache()  # sha1(keyword + domain) -> {"time", "result"}
         
+    def _result_cache_key(self, keyword: str) -> str:
+        return hashlib.sha1(f"{keyword}\n{self.domain}".encode('utf-8')).hexdigest()
+    
+    def _load_result_cache(self) -> Dict:
+        """Load results from previous runs that are still within the TTL."""
+        if not RESULT_CACHE_TTL or not os.path.exists(RESULT_CACHE_FILE):
+            return {}
+        try:
+            cache = _json_loads(Path(RESULT_CACHE_FILE).read_bytes())
+            now = time.time()
+            fresh = {k: v for k, v in cache.items() if now - v.get("time", 0) < RESULT_CACHE_TTL}
+            # Make sure every entry still maps onto a ResultRow
+            for entry in fresh.values():
+                ResultRow(**entry["result"])
+            return fresh
+        except Exception as e:
+            logger.warning(f"⚠️  Error loading {RESULT_CACHE_FILE}: {e}. Ignoring cached results.")
+            return {}
+    
+    def _save_result_cache(self):
+        """Persist the result cache for the next run."""
+        if not RESULT_CACHE_TTL:
+            return
+        try:
+            Path(RESULT_CACHE_FILE).write_text(
+                json.dumps(self._result_cache, ensure_ascii=False, indent=2), encoding='utf-8'
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  Error saving {RESULT_CACHE_FILE}: {e}")
+    
+    async def _route_resource(self, route):
+        """Abort requests for resource types we never use, let everything else through."""
+        request = route.request
+        # reCAPTCHA image challenges must still load so they can be solved manually
+        if request.resource_type in BLOCKED_RESOURCE_TYPES and "recaptcha" not in request.url:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def _pace(self, low: float, high: float):
+        """Wait out the previous pause, then schedule a new random one of low-high seconds.
+        Work done between two _pace calls counts towards the pause, so back-to-back calls
+        only sleep once and slow CDP calls aren't followed by a full extra delay."""
+        remaining = self._next_action_ts - time.monotonic()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        self._next_action_ts = time.monotonic() + random.uniform(low, high)
+    
     async def human_type(self, page, element, text: str):
-        """Type text in a human-like manner with random delays."""
+        """Type text in a few chunks with random pauses (one call per chunk, not per character)."""
         await element.click()
         await asyncio.sleep(random.uniform(0.2, 0.5))
-        
-        for char in text:
-            await element.type(char, delay=random.randint(50, 150))
-            if random.random() < 0.1:  # 10% chance of small pause
-                await asyncio.sleep(random.uniform(0.1, 0.3))
+
+        # Split into 3-5 chunks at random offsets
+        chunk_count = min(len(text), random.randint(3, 5))
+        cuts = sorted(random.sample(range(1, len(text)), chunk_count - 1)) if chunk_count > 1 else []
+        bounds = [0] + cuts + [len(text)]
+
+        for start, end in zip(bounds, bounds[1:]):
+            chunk = text[start:end]
+            await page.keyboard.insert_text(chunk)
+            # Roughly the same per-character timing as before (50-150ms + occasional pause)
+            await asyncio.sleep(random.uniform(0.05, 0.25) * len(chunk))
     
     async def random_mouse_movement(self, page):
         """Perform random mouse movements to appear more human-like."""
@@ -102,37 +342,27 @@ class SEOAutomation:
         except:
             pass
     
-    async def check_for_captcha(self, page) -> bool:
-        """Check if CAPTCHA is present on the page."""
-        captcha_selectors = [
-            "iframe[src*='recaptcha']",
-            "div[id*='recaptcha']",
-            "div[class*='captcha']",
-            "iframe[title*='reCAPTCHA']",
-            "div:has-text('I'm not a robot')",
-            "div:has-text('ロボットではありません')"
-        ]
-        
-        for selector in captcha_selectors:
+    def _on_frame_navigated(self, frame):
+        """Forget the cached CAPTCHA result for a URL whenever the main frame lands on it."""
+        if frame.parent_frame is None:
+            self._captcha_cache.pop(frame.url, None)
+    
+    async def check_for_captcha(self, page, use_cache: bool = True) -> bool:
+        """Check if CAPTCHA is present on the page (single in-page DOM probe).
+        Results are cached per URL until the next navigation; pass use_cache=False
+        after acting on the page without navigating (e.g. after a solve attempt)."""
+        url = page.url
+        if use_cache and url in self._captcha_cache:
+            present = self._captcha_cache[url]
+        else:
             try:
-                elements = page.locator(selector)
-                count = await elements.count()
-                if count > 0:
-                    return True
-            except:
-                continue
-        
-        # Check page content for CAPTCHA indicators
-        try:
-            content = await page.content()
-            if 'recaptcha' in content.lower() or 'captcha' in content.lower():
-                # Check if it's visible
-                if await page.locator("iframe[src*='recaptcha']").count() > 0:
-                    return True
-        except:
-            pass
-        
-        return False
+                present = bool(await page.evaluate(_CAPTCHA_JS))
+            except Exception as e:
+                logger.debug("CAPTCHA probe failed: %s", e)
+                return False
+            self._captcha_cache[url] = present
+        self._captcha_seen = self._captcha_seen or present
+        return present
     
     async def solve_captcha_automatically(self, page) -> bool:
         """Attempt to solve CAPTCHA automatically using a service."""
@@ -155,29 +385,28 @@ class SEOAutomation:
                 # Try to get from page content
                 try:
                     content = await page.content()
-                    import re
-                    match = re.search(r'data-sitekey="([^"]+)"', content)
+                    match = _SITEKEY_RE.search(content)
                     if match:
                         site_key = match.group(1)
                 except:
                     pass
             
             if not site_key:
-                print("   ⚠️  Could not extract reCAPTCHA site key")
+                logger.info("   ⚠️  Could not extract reCAPTCHA site key")
                 return False
             
-            print(f"   🔧 Attempting automatic CAPTCHA solve using {CAPTCHA_SERVICE}...")
+            logger.info(f"   🔧 Attempting automatic CAPTCHA solve using {CAPTCHA_SERVICE}...")
             
             if CAPTCHA_SERVICE.lower() == "2captcha":
                 return await self._solve_with_2captcha(page, site_key)
             elif CAPTCHA_SERVICE.lower() == "anticaptcha":
                 return await self._solve_with_anticaptcha(page, site_key)
             else:
-                print(f"   ⚠️  Unknown CAPTCHA service: {CAPTCHA_SERVICE}")
+                logger.info(f"   ⚠️  Unknown CAPTCHA service: {CAPTCHA_SERVICE}")
                 return False
                 
         except Exception as e:
-            print(f"   ❌ Error in automatic CAPTCHA solving: {e}")
+            logger.info(f"   ❌ Error in automatic CAPTCHA solving: {e}")
             return False
     
     async def _solve_with_2captcha(self, page, site_key: str) -> bool:
@@ -199,11 +428,11 @@ class SEOAutomation:
                 }) as resp:
                     result = await resp.json()
                     if result.get("status") != 1:
-                        print(f"   ❌ 2Captcha error: {result.get('request', 'Unknown error')}")
+                        logger.info(f"   ❌ 2Captcha error: {result.get('request', 'Unknown error')}")
                         return False
                     
                     task_id = result.get("request")
-                    print(f"   ⏳ CAPTCHA submitted, task ID: {task_id}")
+                    logger.info(f"   ⏳ CAPTCHA submitted, task ID: {task_id}")
                 
                 # Wait for solution (poll every 5 seconds, max 2 minutes)
                 for _ in range(24):  # 24 * 5 = 120 seconds
@@ -213,7 +442,7 @@ class SEOAutomation:
                         result = await resp.json()
                         if result.get("status") == 1:
                             token = result.get("request")
-                            print(f"   ✅ CAPTCHA solved! Injecting token...")
+                            logger.info(f"   ✅ CAPTCHA solved! Injecting token...")
                             
                             # Inject the token using multiple methods
                             try:
@@ -266,43 +495,51 @@ class SEOAutomation:
                                 
                                 return True
                             except Exception as e:
-                                print(f"   ⚠️  Error injecting token: {e}")
+                                logger.info(f"   ⚠️  Error injecting token: {e}")
                                 return False
                         elif result.get("request") != "CAPCHA_NOT_READY":
-                            print(f"   ❌ 2Captcha error: {result.get('request', 'Unknown error')}")
+                            logger.info(f"   ❌ 2Captcha error: {result.get('request', 'Unknown error')}")
                             return False
                 
-                print(f"   ⏰ Timeout waiting for 2Captcha solution")
+                logger.info(f"   ⏰ Timeout waiting for 2Captcha solution")
                 return False
         except ImportError:
-            print(f"   ⚠️  aiohttp not installed. Install it with: pip install aiohttp")
+            logger.info(f"   ⚠️  aiohttp not installed. Install it with: pip install aiohttp")
             return False
         except Exception as e:
-            print(f"   ❌ Error with 2Captcha: {e}")
+            logger.info(f"   ❌ Error with 2Captcha: {e}")
             return False
     
     async def _solve_with_anticaptcha(self, page, site_key: str) -> bool:
         """Solve CAPTCHA using AntiCaptcha service."""
-        print(f"   ⚠️  AntiCaptcha integration not yet implemented")
+        logger.info(f"   ⚠️  AntiCaptcha integration not yet implemented")
         return False
     
+    async def _report_captcha_wait(self):
+        """Print a status line every 30 seconds while waiting for a manual CAPTCHA solve."""
+        elapsed_seconds = 0
+        while True:
+            await asyncio.sleep(30)
+            elapsed_seconds += 30
+            logger.info(f"   ⏳ Still waiting for manual CAPTCHA solve... ({elapsed_seconds // 60} minute(s) elapsed)")
+
     async def handle_captcha(self, page, keyword: str) -> bool:
         """Handle CAPTCHA - solve automatically, wait for manual solve, or skip."""
         if await self.check_for_captcha(page):
-            print(f"\n⚠️  CAPTCHA detected for keyword: '{keyword}'")
+            logger.info(f"\n⚠️  CAPTCHA detected for keyword: '{keyword}'")
             
             # Option 1: Try automatic solving FIRST (if configured)
             if CAPTCHA_SERVICE and CAPTCHA_API_KEY:
-                print(f"🤖 Attempting automatic CAPTCHA solving using {CAPTCHA_SERVICE}...")
+                logger.info(f"🤖 Attempting automatic CAPTCHA solving using {CAPTCHA_SERVICE}...")
                 solved = await self.solve_captcha_automatically(page)
                 if solved:
                     # Wait a bit and check if CAPTCHA is gone
                     await asyncio.sleep(3)
-                    if not await self.check_for_captcha(page):
-                        print("✅ CAPTCHA solved automatically! Continuing...")
+                    if not await self.check_for_captcha(page, use_cache=False):
+                        logger.info("✅ CAPTCHA solved automatically! Continuing...")
                         return True
                     else:
-                        print("⚠️  CAPTCHA still present after automatic solve")
+                        logger.info("⚠️  CAPTCHA still present after automatic solve")
                         # Try clicking the submit button if it exists
                         try:
                             submit_btn = page.locator("button[type='submit'], button:has-text('Submit'), button:has-text('送信')")
@@ -314,8 +551,8 @@ class SEOAutomation:
             
             # Option 2: Skip CAPTCHA but continue searching (if skip_captcha enabled)
             if SKIP_CAPTCHA:
-                print("⏭️  CAPTCHA detected but continuing anyway (skip_captcha enabled).")
-                print("   Attempting to continue search despite CAPTCHA...")
+                logger.info("⏭️  CAPTCHA detected but continuing anyway (skip_captcha enabled).")
+                logger.info("   Attempting to continue search despite CAPTCHA...")
                 # Wait a bit and try to continue
                 await asyncio.sleep(random.uniform(2, 4))
                 # Try to refresh the page to see if we can proceed
@@ -323,10 +560,10 @@ class SEOAutomation:
                     await page.reload(wait_until="domcontentloaded")
                     await asyncio.sleep(random.uniform(1, 2))
                     # Check if CAPTCHA is still there
-                    if await self.check_for_captcha(page):
-                        print("   ⚠️  CAPTCHA still present, but continuing search anyway...")
+                    if await self.check_for_captcha(page, use_cache=False):
+                        logger.info("   ⚠️  CAPTCHA still present, but continuing search anyway...")
                     else:
-                        print("   ✅ CAPTCHA cleared after refresh!")
+                        logger.info("   ✅ CAPTCHA cleared after refresh!")
                 except:
                     pass
                 # Return True to continue despite CAPTCHA
@@ -334,411 +571,395 @@ class SEOAutomation:
             
             # Option 3: Wait for manual solve (unlimited time)
             if WAIT_FOR_CAPTCHA_MANUAL:
-                print("⏸️  Waiting for you to solve CAPTCHA manually...")
-                print("   Please solve the CAPTCHA in the browser window.")
-                print("   The script will wait UNLIMITED time until you solve it.")
-                print("   (Press Ctrl+C to cancel if needed)")
+                logger.info("⏸️  Waiting for you to solve CAPTCHA manually...")
+                logger.info("   Please solve the CAPTCHA in the browser window.")
+                logger.info("   The script will wait UNLIMITED time until you solve it.")
+                logger.info("   (Press Ctrl+C to cancel if needed)")
                 
-                # Wait indefinitely for CAPTCHA to be solved
-                check_count = 0
-                while True:
-                    await asyncio.sleep(2)  # Check every 2 seconds
-                    check_count += 1
-                    
-                    if not await self.check_for_captcha(page):
-                        print("✅ CAPTCHA appears to be solved! Continuing...")
-                        await asyncio.sleep(2)
-                        return True
-                    
-                    # Print status every 30 seconds (15 checks * 2 seconds)
-                    if check_count % 15 == 0:
-                        elapsed_minutes = (check_count * 2) // 60
-                        print(f"   ⏳ Still waiting for manual CAPTCHA solve... ({elapsed_minutes} minute(s) elapsed)")
+                # Wait indefinitely for CAPTCHA to be solved (evaluated in-page, no polling round-trips)
+                status_task = asyncio.create_task(self._report_captcha_wait())
+                try:
+                    await page.wait_for_function(_CAPTCHA_SOLVED_JS, timeout=0)
+                finally:
+                    status_task.cancel()
+                # The solve may not navigate, so drop the stale cached result
+                self._captcha_cache.pop(page.url, None)
+
+                logger.info("✅ CAPTCHA appears to be solved! Continuing...")
+                await asyncio.sleep(2)
+                return True
             else:
-                print("⏭️  Skipping this search due to CAPTCHA.")
+                logger.info("⏭️  Skipping this search due to CAPTCHA.")
                 return False
         
         return True
         
     async def check_page_for_target(self, page, domain: str, page_num: int = 1) -> tuple:
-        """Check current page for target URL. Returns (found, link_element, position, total_on_page)."""
-        # Multiple strategies to find search results
-        selectors = [
-            f"a[href*='{domain}']",  # Direct href match
-            f"a[data-ved][href*='{domain}']",  # Google's data-ved attribute
-            f"div.g a[href*='{domain}']",  # Inside Google result divs
-        ]
+        """Check current page for target URL.
+        Returns (found, link_element, position, total_on_page, link_urls) where link_urls is
+        {"attr": raw href, "full": resolved href} so the click doesn't have to read them again."""
+        # Collect every matching anchor in one in-page pass instead of one round-trip per link
+        matches = await page.evaluate(_TARGET_LINKS_JS, [domain, self.target_url, MAX_RESULTS_TO_CHECK])
+        if matches:
+            first = matches[0]
+            link_urls = {"attr": first["h"], "full": first["f"]}
+            return (True, page.locator("a[href]").nth(first["i"]), first["p"], len(matches), link_urls)
         
-        search_results = None
-        for selector in selectors:
+        return (False, None, None, 0, None)
+    
+    async def _acquire_result_page(self, context):
+        """Take an idle result tab from the pool, or open a new one if none are left."""
+        while self._result_page_pool:
+            result_page = self._result_page_pool.pop()
+            if not result_page.is_closed():
+                return result_page
+        return await context.new_page()
+    
+    async def _release_result_page(self, result_page):
+        """Blank a result tab and return it to the pool. Never raises: the visit already happened."""
+        if result_page.is_closed():
+            return
+        try:
+            await result_page.goto("about:blank", wait_until="commit")
+            self._result_page_pool.append(result_page)
+        except Exception as e:
+            logger.debug("Could not recycle result tab: %s", e)
             try:
-                results = page.locator(selector)
-                count = await results.count()
-                if count > 0:
-                    search_results = results
-                    break
-            except:
-                continue
-        
-        if search_results is None:
-            # Fallback: get all links and check manually
-            all_links = page.locator("a[href]")
-            link_count = await all_links.count()
-            
-            for i in range(min(link_count, MAX_RESULTS_TO_CHECK * 3)):
-                try:
-                    link = all_links.nth(i)
-                    href = await link.get_attribute("href")
-                    if href and domain in href:
-                        return (True, link, i + 1, link_count)
-                except:
-                    continue
-        else:
-            result_count = await search_results.count()
-            for i in range(min(result_count, MAX_RESULTS_TO_CHECK)):
-                try:
-                    result_link = search_results.nth(i)
-                    href = await result_link.get_attribute("href")
-                    if href and (self.target_url in href or domain in href):
-                        return (True, result_link, i + 1, result_count)
-                except:
-                    continue
-        
-        return (False, None, None, 0)
+                await result_page.close()
+            except Exception as e:
+                logger.debug("Could not close result tab: %s", e)
     
-    async def click_on_result(self, page, link, position: int, page_num: int, context=None) -> tuple:
-        """Open the found result in a new tab, wait, then return to search tab. Returns (success, new_page)."""
-        new_page = None
+    async def click_on_result(self, page, link, position: int, page_num: int, context=None, link_urls=None) -> bool:
+        """Open the found result in a new tab, wait, then return to search tab. Returns True if successful.
+        link_urls is the {"attr", "full"} dict from check_page_for_target, if already known."""
         try:
-            print(f"✅ Found your site on page {page_num}, position {position}!")
+            logger.info(f"✅ Found your site on page {page_num}, position {position}!")
             
             # Scroll to the result to ensure it's visible
             await link.scroll_into_view_if_needed()
             await asyncio.sleep(random.uniform(0.5, 1))
             
-            # Get the URL from the link
-            href = await link.get_attribute("href")
-            if not href:
-                # Try to get it via JavaScript
-                href = await link.evaluate("element => element.href")
+            # Get both the raw attribute and the browser-resolved URL in one call (unless already known)
+            if not link_urls:
+                link_urls = await link.evaluate("e => ({attr: e.getAttribute('href'), full: e.href})")
+            href = link_urls["attr"]
+            # Keep Google's raw /url? redirect for unwrapping; otherwise prefer the resolved URL
+            if not href or not (href.startswith('/url?') or href.startswith(('http://', 'https://'))):
+                href = link_urls["full"] or href
             
             # Clean up the URL (Google sometimes adds tracking parameters)
-            if href:
-                # Remove Google's tracking parameters
-                if href.startswith('/url?q='):
-                    parsed = urllib.parse.parse_qs(urllib.parse.urlparse(href).query)
-                    if 'q' in parsed:
-                        href = parsed['q'][0]
-                elif href.startswith('/url?'):
-                    parsed = urllib.parse.parse_qs(urllib.parse.urlparse(href).query)
-                    if 'url' in parsed:
-                        href = parsed['url'][0]
-                
-                # Ensure it's a full URL
-                if href and not href.startswith('http'):
-                    if href.startswith('//'):
-                        href = 'https:' + href
-                    elif href.startswith('/'):
-                        href = 'https://www.google.com' + href
-                    else:
-                        href = 'https://' + href
+            href = clean_result_url(href)
             
             if not href:
-                print(f"⚠️  Could not extract URL from link, trying click method...")
+                logger.info(f"⚠️  Could not extract URL from link, trying click method...")
                 # Fallback: try clicking with Ctrl+Click to open in new tab
                 try:
                     await link.click(modifiers=['Control'], timeout=5000)
-                    print(f"🖱️  Opened in new tab (Ctrl+Click)!")
+                    logger.info(f"🖱️  Opened in new tab (Ctrl+Click)!")
                     await asyncio.sleep(random.uniform(1, 2))
                     # Switch back to original page
                     await page.bring_to_front()
-                    return (True, None)
+                    return True
                 except:
                     try:
                         # Try with Cmd on Mac or just regular click
                         await link.click(timeout=5000)
-                        print(f"🖱️  Clicked on link!")
+                        logger.info(f"🖱️  Clicked on link!")
                         await asyncio.sleep(random.uniform(1, 2))
-                        return (True, None)
+                        return True
                     except Exception as e:
-                        print(f"❌ Error clicking: {e}")
-                        return (False, None)
+                        logger.info(f"❌ Error clicking: {e}")
+                        return False
             else:
                 # Open URL in a new tab
                 if context:
-                    new_page = await context.new_page()
-                    print(f"🆕 Opening {href} in new tab...")
-                    await new_page.goto(href, wait_until="domcontentloaded", timeout=15000)
-                    print(f"✅ Opened your site in new tab!")
-                    
-                    # Wait on the new page
+                    result_page = await self._acquire_result_page(context)
                     try:
-                        await new_page.wait_for_load_state("networkidle", timeout=10000)
-                    except:
-                        # If networkidle times out, just wait for domcontentloaded
-                        await new_page.wait_for_load_state("domcontentloaded", timeout=5000)
-                    
-                    wait_time = random.uniform(*DELAY_BETWEEN_CLICKS)
-                    print(f"⏳ Waiting {wait_time:.1f} seconds on your site...")
-                    await asyncio.sleep(wait_time)
-                    
-                    # Switch back to the search results page
-                    await page.bring_to_front()
-                    print(f"↩️  Returned to search results tab")
-                    await asyncio.sleep(random.uniform(0.5, 1))
-                    
-                    # Keep the new tab open (don't close it)
-                    # The search results page is now active again
+                        logger.info(f"🆕 Opening {href} in new tab...")
+                        await result_page.goto(href, wait_until="domcontentloaded", timeout=15000)
+                        logger.info(f"✅ Opened your site in new tab!")
+                        
+                        # Wait until the page body is attached (don't wait for analytics traffic to go idle)
+                        try:
+                            await result_page.wait_for_selector("body", state="attached", timeout=5000)
+                        except PlaywrightTimeoutError:
+                            pass
+                        
+                        wait_time = random.uniform(*DELAY_BETWEEN_CLICKS)
+                        logger.info(f"⏳ Waiting {wait_time:.1f} seconds on your site...")
+                        await asyncio.sleep(wait_time)
+                        
+                        # Switch back to the search results page
+                        await page.bring_to_front()
+                        logger.info(f"↩️  Returned to search results tab")
+                        await asyncio.sleep(random.uniform(0.5, 1))
+                    finally:
+                        # Hand the tab back to the pool for the next keyword instead of leaking it
+                        await self._release_result_page(result_page)
                 else:
                     # If context is not available, try opening with JavaScript
                     await page.evaluate(f"window.open('{href}', '_blank')")
-                    print(f"🆕 Opened {href} in new tab (via JavaScript)!")
+                    logger.info(f"🆕 Opened {href} in new tab (via JavaScript)!")
                     await asyncio.sleep(random.uniform(1, 2))
                     # Focus back on the original page
                     await page.bring_to_front()
-                    print(f"↩️  Returned to search results tab")
+                    logger.info(f"↩️  Returned to search results tab")
             
-            return (True, new_page)
+            return True
         except PlaywrightTimeoutError:
-            print(f"❌ Timeout while opening URL")
-            return (False, new_page)
+            logger.info(f"❌ Timeout while opening URL")
+            return False
         except Exception as e:
-            print(f"❌ Error opening URL: {e}")
-            return (False, new_page)
+            logger.info(f"❌ Error opening URL: {e}")
+            return False
     
     async def go_to_next_page(self, page) -> bool:
         """Navigate to next page of search results. Returns True if successful."""
         try:
-            # Look for "Next" button or page number links
-            next_selectors = [
-                "a#pnnext",  # Google's next button ID
-                "a[aria-label*='Next']",
-                "a[aria-label*='次へ']",
-                "a:has-text('Next')",
-                "a:has-text('次へ')",
-                "td[style*='text-align:left'] a",  # Next button in pagination
-            ]
-            
-            for selector in next_selectors:
-                try:
-                    next_button = page.locator(selector)
-                    count = await next_button.count()
-                    if count > 0:
-                        # Check if it's actually the next button (not disabled)
-                        is_visible = await next_button.first.is_visible()
-                        # Check if it's not disabled (Google sometimes disables the next button)
-                        is_enabled = await next_button.first.is_enabled()
-                        if is_visible and is_enabled:
-                            # Get href to verify it's a valid next link
-                            href = await next_button.first.get_attribute("href")
-                            if href and ('start=' in href or 'page=' in href or href != '#'):
-                                await next_button.first.scroll_into_view_if_needed()
-                                await asyncio.sleep(random.uniform(0.5, 1))
-                                await next_button.first.click()
-                                await page.wait_for_load_state("domcontentloaded")
-                                await asyncio.sleep(random.uniform(2, 4))
-                                return True
-                except:
-                    continue
-            
-            # Alternative: try clicking on page numbers
-            try:
-                # Get current page number from URL or pagination
-                current_url = page.url
-                if 'start=' in current_url:
-                    # Extract current start value
-                    match = re.search(r'start=(\d+)', current_url)
-                    if match:
-                        current_start = int(match.group(1))
-                        next_start = current_start + 10
-                        # Try to find link with next start value
-                        next_link = page.locator(f"a[href*='start={next_start}']")
-                        if await next_link.count() > 0:
-                            await next_link.first.scroll_into_view_if_needed()
-                            await asyncio.sleep(random.uniform(0.5, 1))
-                            await next_link.first.click()
-                            await page.wait_for_load_state("domcontentloaded")
-                            await asyncio.sleep(random.uniform(2, 4))
-                            return True
-            except:
-                pass
-            
-            # Check if we're at the last page by looking for "no results" or similar indicators
-            try:
-                no_results = page.locator("text=did not match any documents, text=一致するドキュメントはありませんでした")
-                if await no_results.count() > 0:
-                    return False
-            except:
-                pass
+            # Find the "Next" link (or the start=N+10 page link) in a single in-page query
+            href = await page.evaluate(_NEXT_PAGE_JS)
+            if not href:
+                return False
             
-            return False
+            await self._pace(0.5, 1)
+            await page.goto(href, wait_until="domcontentloaded")
+            # One pause covering both the post-navigation settle and the caller's old extra wait
+            await asyncio.sleep(random.uniform(3, 6))
+            return True
         except Exception as e:
-            print(f"⚠️  Error navigating to next page: {e}")
+            logger.info(f"⚠️  Error navigating to next page: {e}")
             return False
     
-    async def search_and_click(self, page, keyword: str, context=None) -> Dict:
+    async def submit_search_from_homepage(self, page, keyword: str) -> bool:
+        """Open Google's homepage and type the keyword into the search box.
+        Returns False if a CAPTCHA on the homepage could not be handled."""
+        # Navigate to Google
+        await page.goto(GOOGLE_URL, wait_until="domcontentloaded")
+        await asyncio.sleep(random.uniform(1, 2))
+        
+        # Random mouse movement
+        await self.random_mouse_movement(page)
+        
+        # Accept cookies if present (common in some regions)
+        try:
+            accept_button = page.locator("button:has-text('Accept'), button:has-text('同意'), button:has-text('すべて同意'), button:has-text('I agree')")
+            if await accept_button.count() > 0:
+                await accept_button.first.click(timeout=2000)
+                await asyncio.sleep(random.uniform(0.5, 1.5))
+        except Exception as e:
+            logger.debug("Cookie consent button click failed: %s", e)
+        
+        # Check for CAPTCHA before searching
+        if await self.check_for_captcha(page):
+            captcha_handled = await self.handle_captcha(page, keyword)
+            if not captcha_handled:
+                # Only skip if handle_captcha explicitly returns False (not skip mode)
+                return False
+            # If skip_captcha is enabled, captcha_handled will be True and we continue
+        
+        # Find search box and enter keyword with human-like typing
+        search_box = page.locator("textarea[name='q'], input[name='q']")
+        await search_box.wait_for(state="visible", timeout=5000)
+        
+        # Human-like typing
+        await self.human_type(page, search_box, keyword)
+        await asyncio.sleep(random.uniform(0.5, 1.5))
+        
+        # Random mouse movement before submitting
+        await self.random_mouse_movement(page)
+        
+        # Submit search
+        await search_box.press("Enter")
+        await page.wait_for_load_state("domcontentloaded")
+        return True
+    
+    async def search_and_click(self, page, keyword: str, context=None) -> ResultRow:
         """Search for a keyword and click on target URL if found on any page."""
-        result = {
-            "keyword": keyword,
-            "found": False,
-            "page": None,
-            "position": None,
-            "clicked": False,
-            "error": None
-        }
+        result = ResultRow(keyword=keyword)
+        self._captcha_seen = False
+        self._last_search_complete = False
+        no_more_pages = False
         
         try:
-            print(f"\n🔍 Searching for: '{keyword}'")
+            logger.info(f"\n🔍 Searching for: '{keyword}'")
             
-            # Navigate to Google
-            await page.goto(GOOGLE_URL, wait_until="domcontentloaded")
-            await asyncio.sleep(random.uniform(1, 2))
+            if DIRECT_SEARCH_URL:
+                # Single navigation straight to the results page
+                # Only wait for the response to commit; the results selector wait below covers rendering
+                await page.goto(f"{GOOGLE_URL}/search?q={urllib.parse.quote_plus(keyword)}", wait_until="commit")
+            elif not await self.submit_search_from_homepage(page, keyword):
+                result.error = "CAPTCHA detected and could not proceed"
+                logger.info(f"⏭️  Skipping keyword '{keyword}' due to CAPTCHA")
+                return result
             
-            # Random mouse movement
-            await self.random_mouse_movement(page)
-            
-            # Accept cookies if present (common in some regions)
             try:
-                accept_button = page.locator("button:has-text('Accept'), button:has-text('同意'), button:has-text('すべて同意'), button:has-text('I agree')")
-                if await accept_button.count() > 0:
-                    await accept_button.first.click(timeout=2000)
-                    await asyncio.sleep(random.uniform(0.5, 1.5))
-            except:
+                await page.wait_for_selector(SERP_RESULTS_SELECTOR, timeout=8000)
+            except PlaywrightTimeoutError:
+                # No results container (e.g. CAPTCHA page) - handled by the checks below
                 pass
-            
-            # Check for CAPTCHA before searching
-            if await self.check_for_captcha(page):
-                captcha_handled = await self.handle_captcha(page, keyword)
-                if not captcha_handled:
-                    # Only skip if handle_captcha explicitly returns False (not skip mode)
-                    result["error"] = "CAPTCHA detected and could not proceed"
-                    print(f"⏭️  Skipping keyword '{keyword}' due to CAPTCHA")
-                    return result
-                # If skip_captcha is enabled, captcha_handled will be True and we continue
-            
-            # Find search box and enter keyword with human-like typing
-            search_box = page.locator("textarea[name='q'], input[name='q']")
-            await search_box.wait_for(state="visible", timeout=5000)
-            
-            # Human-like typing
-            await self.human_type(page, search_box, keyword)
-            await asyncio.sleep(random.uniform(0.5, 1.5))
-            
-            # Random mouse movement before submitting
-            await self.random_mouse_movement(page)
-            
-            # Submit search
-            await search_box.press("Enter")
-            await page.wait_for_load_state("domcontentloaded")
-            await asyncio.sleep(random.uniform(2, 4))
+            await self._pace(0.5, 1)
             
             # Check for CAPTCHA after search
             if await self.check_for_captcha(page):
                 captcha_handled = await self.handle_captcha(page, keyword)
                 if not captcha_handled:
                     # Only skip if handle_captcha explicitly returns False (not skip mode)
-                    result["error"] = "CAPTCHA detected after search and could not proceed"
-                    print(f"⏭️  Skipping keyword '{keyword}' due to CAPTCHA")
+                    result.error = "CAPTCHA detected after search and could not proceed"
+                    logger.info(f"⏭️  Skipping keyword '{keyword}' due to CAPTCHA")
                     return result
                 # If skip_captcha is enabled, captcha_handled will be True and we continue
             
-            # Get domain for searching
-            domain = self.target_url.replace("https://", "").replace("http://", "").split("/")[0]
-            
             # Check if CAPTCHA is blocking the search results
             # If skip_captcha is enabled, try to proceed anyway
             if await self.check_for_captcha(page):
                 if SKIP_CAPTCHA:
-                    print("⚠️  CAPTCHA present on results page, but continuing search anyway...")
+                    logger.info("⚠️  CAPTCHA present on results page, but continuing search anyway...")
                     # Try to scroll past CAPTCHA or wait a bit
-                    await asyncio.sleep(random.uniform(2, 3))
+                    await self._pace(2, 3)
             
             # Search through all pages until found or no more pages
             current_page = 1
-            no_more_pages = False
             
             while True:
-                print(f"📄 Checking page {current_page}...")
+                logger.info(f"📄 Checking page {current_page}...")
                 
-                # Check for CAPTCHA on current page
-                if await self.check_for_captcha(page):
+                # Check for CAPTCHA on current page and do the random human-like scroll
+                # together - they're independent, so both messages go out in one batch
+                captcha_present, _ = await asyncio.gather(
+                    self.check_for_captcha(page),
+                    page.evaluate("window.scrollTo(0, Math.random() * 300)"),
+                )
+                if captcha_present:
                     if SKIP_CAPTCHA:
-                        print("   ⚠️  CAPTCHA detected on this page, but continuing...")
-                        await asyncio.sleep(random.uniform(1, 2))
+                        logger.info("   ⚠️  CAPTCHA detected on this page, but continuing...")
+                        await self._pace(1, 2)
                     else:
                         # If not in skip mode, handle normally
                         captcha_handled = await self.handle_captcha(page, keyword)
                         if not captcha_handled:
+                            result.error = f"CAPTCHA detected on page {current_page} and could not proceed"
+                            logger.info(f"⏭️  Skipping keyword '{keyword}' due to CAPTCHA on page {current_page}")
                             break
                 
-                # Random scroll to appear more human-like
-                await page.evaluate("window.scrollTo(0, Math.random() * 300)")
-                await asyncio.sleep(random.uniform(0.5, 1))
+                await self._pace(0.5, 1)
                 
                 # Check current page for target URL
-                found, link, position, total_results = await self.check_page_for_target(page, domain, current_page)
+                found, link, position, total_results, link_urls = await self.check_page_for_target(page, self.domain, current_page)
                 
                 if found and link:
-                    result["found"] = True
-                    result["page"] = current_page
-                    result["position"] = position
+                    result.found = True
+                    result.page = current_page
+                    result.position = position
                     
                     # Click on the result - open in new tab
-                    clicked, new_page = await self.click_on_result(page, link, position, current_page, context)
+                    clicked = await self.click_on_result(page, link, position, current_page, context, link_urls)
                     if clicked:
-                        result["clicked"] = True
-                        print(f"✅ Successfully opened your site in new tab!")
+                        result.clicked = True
+                        logger.info(f"✅ Successfully opened your site in new tab!")
                         # Move to next keyword after finding and opening
-                        print(f"➡️  Moving to next keyword...")
+                        logger.info(f"➡️  Moving to next keyword...")
                         break
                     else:
                         # If click failed, continue searching
-                        print(f"⚠️  Opening failed, continuing search...")
+                        logger.info(f"⚠️  Opening failed, continuing search...")
                 
                 # Not found on this page, try next page
                 if not found:
-                    print(f"   Not found on page {current_page}")
+                    logger.info(f"   Not found on page {current_page}")
                 
                 # Try to go to next page
                 if await self.go_to_next_page(page):
                     current_page += 1
-                    await asyncio.sleep(random.uniform(1, 2))
                     
                     # Check for CAPTCHA on new page
                     if await self.check_for_captcha(page):
                         captcha_handled = await self.handle_captcha(page, keyword)
                         if not captcha_handled:
                             # Only skip if handle_captcha explicitly returns False (not skip mode)
-                            result["error"] = f"CAPTCHA detected on page {current_page} and could not proceed"
-                            print(f"⏭️  Skipping keyword '{keyword}' due to CAPTCHA on page {current_page}")
+                            result.error = f"CAPTCHA detected on page {current_page} and could not proceed"
+                            logger.info(f"⏭️  Skipping keyword '{keyword}' due to CAPTCHA on page {current_page}")
                             break
                         # If skip_captcha is enabled, captcha_handled will be True and we continue
                 else:
                     # No more pages available
                     no_more_pages = True
-                    print(f"   No more pages available (reached end of results)")
+                    logger.info(f"   No more pages available (reached end of results)")
                     break
             
-            if not result["found"]:
-                print(f"❌ Your site not found in search results (searched {current_page} page(s))")
+            if not result.found:
+                logger.info(f"❌ Your site not found in search results (searched {current_page} page(s))")
             else:
-                if result["clicked"]:
-                    print(f"✅ Successfully found and opened your site in new tab(s)!")
+                if result.clicked:
+                    logger.info(f"✅ Successfully found and opened your site in new tab(s)!")
                 else:
-                    print(f"⚠️  Found but could not open")
+                    logger.info(f"⚠️  Found but could not open")
             
         except Exception as e:
-            result["error"] = str(e)
-            print(f"❌ Error during search: {e}")
+            result.error = str(e)
+            logger.info(f"❌ Error during search: {e}")
         
+        # Only an opened result or a CAPTCHA-free search that reached the last page is worth reusing
+        self._last_search_complete = (
+            not result.error and not self._captcha_seen
+            and (result.clicked or (not result.found and no_more_pages))
+        )
         return result
     
+    async def _connect_browser_daemon(self, p, browser_args: List[str], context_options: Dict):
+        """Connect to the Chromium left running by a previous run, starting it if needed.
+        Returns the connected Browser; its default context uses the persistent profile."""
+        try:
+            return await p.chromium.connect_over_cdp(_browser_daemon_url())
+        except Exception:
+            pass
+        
+        logger.info(f"🌐 Starting browser daemon on port {BROWSER_DAEMON_PORT}...")
+        self.user_data_dir.mkdir(parents=True, exist_ok=True)
+        # The default context of a CDP-connected browser can't take context options,
+        # so user agent and language go on the command line instead
+        command = [
+            p.chromium.executable_path,
+            f"--remote-debugging-port={BROWSER_DAEMON_PORT}",
+            f"--user-data-dir={self.user_data_dir}",
+            f"--user-agent={context_options['user_agent']}",
+            f"--lang={context_options['locale']}",
+            # Playwright adds these itself on launch(); the raw executable needs them to skip first-run UI
+            "--no-first-run",
+            "--no-default-browser-check",
+            # A long-lived browser with an open debugging port must keep its sandbox, same-origin policy
+            # and site isolation
+            *(arg for arg in browser_args if arg not in _DAEMON_UNSAFE_ARGS),
+        ]
+        if HEADLESS:
+            command.append("--headless=new")
+        command.append("about:blank")
+        
+        # Detach so the browser outlives this process
+        popen_options = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL,
+                         "env": {**os.environ, "TZ": context_options['timezone_id']}}
+        if os.name == "nt":
+            popen_options["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            popen_options["start_new_session"] = True
+        subprocess.Popen(command, **popen_options)
+        
+        # Wait for the DevTools endpoint to come up
+        for _ in range(50):
+            await asyncio.sleep(0.2)
+            try:
+                return await p.chromium.connect_over_cdp(_browser_daemon_url())
+            except Exception:
+                continue
+        raise RuntimeError(f"Browser daemon did not start on port {BROWSER_DAEMON_PORT}")
+    
     async def run(self):
-        """Run automation for all keywords."""
-        print(f"🚀 Starting SEO Automation")
-        print(f"📌 Target URL: {self.target_url}")
-        print(f"🔑 Keywords: {len(self.keywords)}")
-        print(f"{'='*60}\n")
+        """Run automation for all keywords.
+        Progress and the summary are logged at INFO on this module's logger; callers outside
+        main() should call setup_logging() (or configure logging themselves) first."""
+        logger.info(f"🚀 Starting SEO Automation")
+        logger.info(f"📌 Target URL: {self.target_url}")
+        logger.info(f"🔑 Keywords: {len(self.keywords)}")
+        logger.info(f"{'='*60}\n")
         
         async with async_playwright() as p:
             # Enhanced browser arguments for stealth mode
@@ -765,8 +986,17 @@ class SEOAutomation:
                 'color_scheme': 'light',
             }
             
+            browser = None
+            if BROWSER_DAEMON_PORT:
+                # Reuse an already-running browser (warm start) and its persistent profile
+                browser = await self._connect_browser_daemon(p, browser_args, context_options)
+                context = browser.contexts[0] if browser.contexts else await browser.new_context(**context_options)
+                await asyncio.gather(
+                    context.grant_permissions(context_options['permissions']),
+                    context.set_geolocation(context_options['geolocation']),
+                )
             # Use persistent context to maintain cookies and session
-            if USE_PERSISTENT_CONTEXT:
+            elif USE_PERSISTENT_CONTEXT:
                 # Create directory if it doesn't exist
                 self.user_data_dir.mkdir(parents=True, exist_ok=True)
                 
@@ -785,83 +1015,123 @@ class SEOAutomation:
                 )
                 context = await browser.new_context(**context_options)
             
-            # Add extra HTTP headers
-            await context.set_extra_http_headers({
-                'Accept-Language': 'ja-JP,ja;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            })
-            
-            # Override webdriver property
-            await context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                
-                // Override plugins
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-                
-                // Override languages
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['ja-JP', 'ja', 'en-US', 'en']
-                });
-            """)
+            # Extra HTTP headers, resource blocking and init script are independent,
+            # so send them together instead of one round-trip after another
+            setup = [
+                context.set_extra_http_headers(EXTRA_HTTP_HEADERS),
+                context.add_init_script(_INIT_SCRIPT),
+            ]
+            if BLOCKED_RESOURCE_TYPES:
+                # Skip unneeded sub-resources - results are text only
+                setup.append(context.route("**/*", self._route_resource))
+            await asyncio.gather(*setup)
             
             page = await context.new_page()
+            page.on("framenavigated", self._on_frame_navigated)
+            if BROWSER_DAEMON_PORT:
+                # The CDP default context has no viewport emulation (viewport_size would be None)
+                await page.set_viewport_size(context_options['viewport'])
             
             try:
                 for i, keyword in enumerate(self.keywords, 1):
-                    print(f"\n{'='*60}")
-                    print(f"Keyword {i}/{len(self.keywords)}")
+                    logger.info(f"\n{'='*60}")
+                    logger.info(f"Keyword {i}/{len(self.keywords)}")
+                    
+                    # Reuse a recent result for the same keyword/domain instead of searching again
+                    cache_key = self._result_cache_key(keyword)
+                    cached = self._result_cache.get(cache_key)
+                    if cached:
+                        logger.info(f"♻️  Using cached result for '{keyword}' (searched within the last {RESULT_CACHE_TTL / 3600:g}h)")
+                        self.results.append(ResultRow(**{**cached["result"], "cached": True}))
+                        continue
                     
                     result = await self.search_and_click(page, keyword, context)
                     self.results.append(result)
+                    if self._last_search_complete:
+                        self._result_cache[cache_key] = {"time": time.time(), "result": asdict(result)}
                     
                     # Random delay between searches (except for last one)
                     if i < len(self.keywords):
                         delay = random.uniform(*DELAY_BETWEEN_SEARCHES)
-                        print(f"⏳ Waiting {delay:.1f} seconds before next search...")
+                        logger.info(f"⏳ Waiting {delay:.1f} seconds before next search...")
                         await asyncio.sleep(delay)
                 
             finally:
-                await context.close()
+                self._save_result_cache()
+                if BROWSER_DAEMON_PORT:
+                    # Close only our tabs and disconnect; the browser keeps running for the next run
+                    for opened in [page, *self._result_page_pool]:
+                        if not opened.is_closed():
+                            await opened.close()
+                    await browser.close()
+                else:
+                    await context.close()
             
             # Print summary
             self.print_summary()
     
     def print_summary(self):
         """Print summary of results."""
-        print(f"\n{'='*60}")
-        print("📊 SUMMARY")
-        print(f"{'='*60}")
-        
-        total_searches = len(self.results)
-        found_count = sum(1 for r in self.results if r["found"])
-        clicked_count = sum(1 for r in self.results if r["clicked"])
-        
-        print(f"Total searches: {total_searches}")
-        print(f"Found: {found_count}")
-        print(f"Clicked: {clicked_count}")
-        print(f"\nDetailed results:")
+        logger.info(f"\n{'='*60}")
+        logger.info("📊 SUMMARY")
+        logger.info(f"{'='*60}")
         
+        # One pass over the results: tally counts and build the detail lines together
+        counts = Counter()
+        details = []
         for result in self.results:
-            status = "✅" if result["clicked"] else ("🔍" if result["found"] else "❌")
-            print(f"{status} {result['keyword']}")
-            if result["found"]:
-                page_info = f"Page {result['page']}" if result.get("page") else "Unknown page"
-                print(f"   Found on: {page_info}, Position: {result['position']}")
-            if result["error"]:
-                print(f"   Error: {result['error']}")
+            counts["clicked"] += result.clicked
+            counts["found"] += result.found
+            counts["cached"] += result.cached
+            
+            details.append(f"{_STATUS_ICONS[result.clicked, result.found]} {result.keyword}"
+                           + (" (cached from a previous run)" if result.cached else ""))
+            if result.found:
+                page_info = f"Page {result.page}" if result.page else "Unknown page"
+                details.append(f"   Found on: {page_info}, Position: {result.position}")
+            if result.error:
+                details.append(f"   Error: {result.error}")
+        
+        logger.info(f"Total searches: {len(self.results)}")
+        logger.info(f"Found: {counts['found']}")
+        logger.info(f"Clicked: {counts['clicked']}")
+        if counts["cached"]:
+            logger.info(f"Reused from cache (not searched this run): {counts['cached']}")
+        logger.info(f"\nDetailed results:")
+        logger.info("\n".join(details))
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """Send log records through a queue so console writes happen off the event loop.
+    Returns the started listener; call stop() on it to flush before exiting."""
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, console)
+    
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(logging.INFO)
+    listener.start()
+    return listener
 
 
 async def main():
     """Main entry point."""
-    automation = SEOAutomation(KEYWORDS, TARGET_URL)
-    await automation.run()
+    parser = argparse.ArgumentParser(description="SEO Automation Tool")
+    parser.add_argument("--shutdown", action="store_true",
+                        help="close the browser daemon started with browser_daemon_port and exit")
+    args = parser.parse_args()
+    
+    log_listener = setup_logging()
+    try:
+        if args.shutdown:
+            await shutdown_browser_daemon()
+            return
+        
+        automation = SEOAutomation(KEYWORDS, TARGET_URL)
+        await automation.run()
+    finally:
+        log_listener.stop()
 
 
 if __name__ == "__main__":